@@ -46,6 +46,7 @@ __all__ = [
     "KisKey",
     "KisAuth",
     "KisCacheStorage",
+    "KisChartCacheStorage",
     "KisForm",
     "KisPage",
     "KisPageStatus",
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from functools import cache
+from typing import TYPE_CHECKING, Callable, Protocol, runtime_checkable
 
 from pykis.api.base.market import KisMarketBase, KisMarketProtocol
 from pykis.api.stock.market import MARKET_TYPE
@@ -15,6 +16,31 @@ __all__ = [
 ]
 
 
+# 순환 참조를 피하기 위해 최초 호출 시에만 import 합니다.
+@cache
+def _get_info() -> Callable[..., "KisStockInfo"]:
+    from pykis.api.stock.info import info
+
+    return info
+
+
+@cache
+def _get_stock() -> Callable[..., "KisStock"]:
+    from pykis.scope.stock import stock
+
+    return stock
+
+
+@cache
+def _get_market_aliases(market: MARKET_TYPE) -> tuple[str | None, ...]:
+    """상품유형타입으로 해석되는 상품유형명 목록을 반환합니다. (예: KRX -> KR, KRX, None)"""
+    from pykis.api.stock.info import MARKET_CODE_MAP, MARKET_TYPE_MAP
+
+    codes = {code for code, market_type in MARKET_CODE_MAP.items() if market_type == market}
+
+    return tuple(alias for alias, alias_codes in MARKET_TYPE_MAP.items() if codes.intersection(alias_codes))
+
+
 @runtime_checkable
 class KisProductProtocol(KisMarketProtocol, Protocol):
     """한국투자증권 상품 프로토콜"""
@@ -79,20 +105,30 @@ class KisProductBase(KisMarketBase):
             KisNotFoundError: 조회 결과가 없는 경우
             ValueError: 종목 코드가 올바르지 않은 경우
         """
-        from pykis.api.stock.info import info as _info
-
-        return _info(
+        return _get_info()(
             self.kis,
             symbol=self.symbol,
             market=self.market,
         )
 
+    def invalidate_info(self):
+        """
+        상품기본정보 캐시를 삭제합니다.
+
+        캐시는 조회 시 입력된 상품유형명으로 저장되므로, 상품유형타입으로 해석되는 모든 상품유형명(국가, 시장, 미지정)의
+        상품기본정보, 시세조회 가능 상품유형명, 상품유형명 해석 캐시를 삭제합니다.
+        """
+        for market in _get_market_aliases(self.market):
+            self.kis.cache.remove(f"info:{market}:{self.symbol}")
+            self.kis.cache.remove(f"quotable_market:{market}:{self.symbol}")
+
+            for quotable in (True, False):
+                self.kis.cache.remove(f"resolve_market:{market}:{quotable}:{self.symbol}")
+
     @property
     def stock(self) -> "KisStock":
         """종목 Scope"""
-        from pykis.scope.stock import stock
-
-        return stock(
+        return _get_stock()(
             self.kis,
             symbol=self.symbol,
             market=self.market,
@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, tzinfo
 from decimal import Decimal
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 from pykis.api.stock.chart import KisChart, KisChartBar, KisChartBarRepr, KisChartBase
@@ -15,7 +17,9 @@ from pykis.api.stock.quote import (
     STOCK_SIGN_TYPE_KOR_MAP,
     STOCK_SIGN_TYPE_MAP,
 )
-from pykis.responses.dynamic import KisDynamic, KisList
+from pykis.client.chart_cache import KisChartCacheStorage
+from pykis.client.object import kis_object_init
+from pykis.responses.dynamic import KisDynamic, KisList, KisObject
 from pykis.responses.response import KisResponse, raise_not_found
 from pykis.responses.types import KisAny, KisDatetime, KisDecimal, KisInt
 from pykis.utils.timezone import TIMEZONE
@@ -34,8 +38,6 @@ class KisDomesticDailyChartBar(KisChartBarRepr, KisDynamic):
 
     time: datetime = KisDatetime("%Y%m%d", timezone=TIMEZONE)["stck_bsop_date"]
     """시간 (현지시간)"""
-    time_kst: datetime = KisDatetime("%Y%m%d", timezone=TIMEZONE)["stck_bsop_date"]
-    """시간 (한국시간)"""
     open: Decimal = KisDecimal["stck_oprc"]
     """시가"""
     close: Decimal = KisDecimal["stck_clpr"]
@@ -61,6 +63,11 @@ class KisDomesticDailyChartBar(KisChartBarRepr, KisDynamic):
     split_ratio: Decimal = KisDecimal["prtt_rate"]
     """분할 비율"""
 
+    @property
+    def time_kst(self) -> datetime:
+        """시간 (한국시간)"""
+        return self.time
+
     @property
     def price(self) -> Decimal:
         """현재가 (종가)"""
@@ -195,7 +202,7 @@ class KisForeignDailyChart(KisResponse, KisChartBase):
 
     def __post_init__(self) -> None:
         for bar in self.bars:
-            bar.time.replace(tzinfo=self.timezone)
+            bar.time = bar.time.replace(tzinfo=self.timezone)
             bar.time_kst = bar.time.astimezone(TIMEZONE)  # type: ignore
 
 
@@ -219,13 +226,179 @@ def drop_after(
         if end and bar.time.date() > end:
             continue
 
-        bars.insert(0, bar)
+        bars.append(bar)
 
+    bars.reverse()
     chart.bars = bars
 
     return chart
 
 
+DOMESTIC_MAX_RECORDS = 100
+DOMESTIC_MAX_WORKERS = 8
+
+DOMESTIC_PERIOD_CODE_MAP: dict[str, str] = {
+    "day": "D",
+    "week": "W",
+    "month": "M",
+    "year": "Y",
+}
+DOMESTIC_PERIOD_DELTA_MAP: dict[str, timedelta] = {
+    "day": timedelta(days=1),
+    "week": timedelta(days=7),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365),
+}
+DOMESTIC_PERIOD_WINDOW_MAP: dict[str, timedelta] = {
+    # 평일에만 거래하므로, 최대 레코드 수를 주당 5봉으로 나눈 주 수만큼의 기간에는 최대 레코드 수 이하의 봉만 존재합니다.
+    "day": timedelta(weeks=DOMESTIC_MAX_RECORDS // 5) - timedelta(days=1),
+    "week": (DOMESTIC_MAX_RECORDS - 1) * DOMESTIC_PERIOD_DELTA_MAP["week"],
+    "month": (DOMESTIC_MAX_RECORDS - 1) * DOMESTIC_PERIOD_DELTA_MAP["month"],
+    "year": (DOMESTIC_MAX_RECORDS - 1) * DOMESTIC_PERIOD_DELTA_MAP["year"],
+}
+
+
+def _sort_domestic_daily_chart(
+    chart: KisDomesticDailyChart,
+    bars: list[KisChartBar],
+    start: date | timedelta | None,
+    end: date | None,
+) -> KisDomesticDailyChart:
+    # 페이지 단위로 정렬된 봉을 한 번에 오름차순 정렬한 뒤, 조회 기간 밖의 봉을 제거합니다.
+    bars.sort(key=attrgetter("time"))
+
+    if isinstance(start, timedelta):
+        start = (bars[-1].time - start).date() if bars else None
+
+    chart.bars = [
+        bar
+        for bar in bars
+        if (not start or bar.time.date() >= start) and (not end or bar.time.date() <= end)
+    ]
+
+    return chart
+
+
+def _fetch_domestic_daily_chart(
+    self: "PyKis",
+    symbol: str,
+    start: date | None,
+    end: date,
+    period_code: str,
+    adjust: bool,
+) -> KisDomesticDailyChart:
+    return self.fetch(
+        "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice",
+        api="FHKST03010100",
+        params={
+            "FID_COND_MRKT_DIV_CODE": "J",
+            "FID_INPUT_ISCD": symbol,
+            "FID_INPUT_DATE_1": start.strftime("%Y%m%d") if start else "00000101",
+            "FID_INPUT_DATE_2": end.strftime("%Y%m%d"),
+            "FID_PERIOD_DIV_CODE": period_code,
+            "FID_ORG_ADJ_PRC": "0" if adjust else "1",
+        },
+        response_type=KisDomesticDailyChart(symbol=symbol),
+        domain="real",
+    )
+
+
+def _fetch_domestic_daily_chart_ranges(
+    self: "PyKis",
+    symbol: str,
+    ranges: list[tuple[date, date]],
+    period_code: str,
+    period_delta: timedelta,
+    window: timedelta,
+    adjust: bool,
+) -> list[KisDomesticDailyChart]:
+    # 각 구간을 최대 레코드 수를 넘지 않는 창으로 나누어, 최근 창부터 최대 동시 조회 수만큼씩 조회합니다.
+    # 가장 오래된 창의 첫 봉이 창 시작일보다 이만큼 이후라면, 창 중간에 상장된 것으로 봅니다.
+    gap = period_delta + timedelta(days=14)
+    results: list[KisDomesticDailyChart] = []
+
+    def fetch(w: tuple[date, date]) -> KisDomesticDailyChart:
+        return _fetch_domestic_daily_chart(self, symbol, w[0], w[1], period_code, adjust)
+
+    with ThreadPoolExecutor(max_workers=DOMESTIC_MAX_WORKERS) as executor:
+        for start, end in ranges:
+            cursor: date | None = end
+
+            while cursor is not None:
+                windows: list[tuple[date, date]] = []
+
+                while cursor is not None and len(windows) < DOMESTIC_MAX_WORKERS:
+                    # 시작일 이전으로 계산하지 않도록 하여 date.min 부근에서도 범위를 벗어나지 않습니다.
+                    window_start = start if cursor - start <= window else cursor - window
+                    windows.append((window_start, cursor))
+                    cursor = window_start - timedelta(days=1) if window_start > start else None
+
+                batch = list(executor.map(fetch, windows))
+                results.extend(batch)
+
+                if cursor is None:
+                    break
+
+                oldest = batch[-1].bars
+
+                if oldest and oldest[-1].time.date() <= windows[-1][0] + gap:
+                    continue
+
+                # 가장 오래된 창이 비었거나 일부만 채워진 경우, 남은 기간의 최근 봉을 한 번만 조회하여
+                # 상장 이전이라면 중단하고, 장기간 거래정지 등으로 비어 있던 것이라면 해당 봉부터 이어서 조회합니다.
+                result = fetch((start, cursor))
+
+                if not result.bars:
+                    break
+
+                results.append(result)
+                last = result.bars[-1].time.date()
+                cursor = (
+                    last - timedelta(days=1) if last > start and len(result.bars) >= DOMESTIC_MAX_RECORDS else None
+                )
+
+    return results
+
+
+def _save_domestic_daily_chart(
+    cache: KisChartCacheStorage,
+    symbol: str,
+    period: str,
+    start: date,
+    end: date,
+    cached: tuple[date, date, dict[str, Any]] | None,
+    results: list[KisDomesticDailyChart],
+):
+    # 당일 봉은 장중 변경될 수 있으므로 저장하지 않습니다.
+    today = datetime.now(TIMEZONE).date()
+    end = min(end, today - timedelta(days=1))
+
+    if start > end:
+        return
+
+    if cached:
+        if cached[0] - timedelta(days=1) <= end and start <= cached[1] + timedelta(days=1):
+            start, end = min(start, cached[0]), max(end, cached[1])
+        elif cached[1] - cached[0] > end - start:
+            # 저장된 기간과 이어지지 않는 경우, 더 긴 기간을 유지합니다.
+            start, end = cached[0], cached[1]
+
+    cache.set(
+        "KRX",
+        symbol,
+        period,
+        start=start,
+        end=end,
+        data={key: value for key, value in results[0].__data__.items() if key not in ("__response__", "output2")},
+        bars={
+            bar.time.date(): bar.__data__
+            for result in results
+            for bar in result.bars
+            if bar.time.date() < today
+        },
+    )
+
+
 def domestic_daily_chart(
     self: "PyKis",
     symbol: str,
@@ -237,6 +410,9 @@ def domestic_daily_chart(
     """
     한국투자증권 국내 기간 차트 조회
 
+    조회 시작 시간이 날짜로 주어진 경우, 조회 구간을 최대 레코드 수 단위로 나누어 동시에 조회합니다.
+    `PyKis.chart_cache`가 지정된 경우, 원주가 일봉은 캐시 저장소에 저장되지 않은 기간만 조회합니다.
+
     국내주식시세 -> 국내주식기간별시세(일/주/월/년)[v1_국내주식-016]
     (업데이트 날짜: 2023-10-02)
 
@@ -267,31 +443,85 @@ def domestic_daily_chart(
     if isinstance(start, date) and end and start > end:
         start, end = end, start
 
+    period_code = DOMESTIC_PERIOD_CODE_MAP[period]
+    period_delta = DOMESTIC_PERIOD_DELTA_MAP[period]
+
+    if isinstance(start, date):
+        # 장이 마감된 일봉은 변경되지 않으므로, 원주가 일봉 조회 시 캐시 저장소에 저장된 기간을 제외하고 조회합니다.
+        cache = self.chart_cache if period == "day" and not adjust else None
+        cached = cache.range("KRX", symbol, period) if cache else None
+        ranges = [(start, end)]
+
+        if cached:
+            cached_start, cached_end, _ = cached
+            ranges = [
+                (s, e)
+                for s, e in (
+                    (max(start, cached_end + timedelta(days=1)), end),
+                    (start, min(end, cached_start - timedelta(days=1))),
+                )
+                if s <= e
+            ]
+
+        results = _fetch_domestic_daily_chart_ranges(
+            self,
+            symbol,
+            ranges,
+            period_code,
+            period_delta,
+            DOMESTIC_PERIOD_WINDOW_MAP[period],
+            adjust,
+        )
+        bars: dict[datetime, KisChartBar] = {}
+
+        for result in results:
+            for bar in result.bars:
+                if bar.time not in bars:
+                    bars[bar.time] = bar
+
+        if cache:
+            if cached:
+                for row in cache.bars("KRX", symbol, period, max(start, cached[0]), min(end, cached[1])):
+                    bar = KisObject.transform_(row, KisDomesticDailyChartBar)
+
+                    if bar.time not in bars:
+                        bars[bar.time] = bar
+
+            if results:
+                _save_domestic_daily_chart(cache, symbol, period, start, end, cached, results)
+
+        if results:
+            chart = results[0]
+        else:
+            chart = KisObject.transform_(
+                {**cached[2], "__response__": None, "output2": []},  # type: ignore
+                KisDomesticDailyChart(symbol=symbol),
+            )
+            kis_object_init(self, chart)
+
+        return _sort_domestic_daily_chart(
+            chart,
+            list(bars.values()),
+            start=start,
+            end=end,
+        )
+
     cursor = end
     chart = None
-    period_delta = timedelta(
-        days=1 if period == "day" else 7 if period == "week" else 30 if period == "month" else 365
-    )
+    bars: list[KisChartBar] = []
+    seen_dates: set[date] = set()
 
     while True:
-        result = self.fetch(
-            "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice",
-            api="FHKST03010100",
-            params={
-                "FID_COND_MRKT_DIV_CODE": "J",
-                "FID_INPUT_ISCD": symbol,
-                "FID_INPUT_DATE_1": start.strftime("%Y%m%d") if isinstance(start, date) else "00000101",
-                "FID_INPUT_DATE_2": cursor.strftime("%Y%m%d"),
-                "FID_PERIOD_DIV_CODE": (
-                    "D" if period == "day" else "W" if period == "week" else "M" if period == "month" else "Y"
-                ),
-                "FID_ORG_ADJ_PRC": "0" if adjust else "1",
-            },
-            response_type=KisDomesticDailyChart(symbol=symbol),
-            domain="real",
+        result = _fetch_domestic_daily_chart(
+            self,
+            symbol,
+            start if isinstance(start, date) else None,
+            cursor,
+            period_code,
+            adjust,
         )
 
-        if not chart:
+        if chart is None:
             chart = result
 
         if not result.bars:
@@ -299,22 +529,28 @@ def domestic_daily_chart(
 
         last = result.bars[-1].time.date()
 
-        if cursor and cursor < last:
+        if result is not chart and last >= cursor:
+            # 이전 조회 시간 이후의 봉만 반환된 경우, 더 이상 진행되지 않습니다.
             break
 
-        if chart and result != chart:
-            chart.bars.extend(result.bars)
+        bars.extend(bar for bar in result.bars if bar.time.date() not in seen_dates)
+        seen_dates.update(bar.time.date() for bar in result.bars)
 
         if isinstance(start, timedelta):
-            start = (chart.bars[0].time - start).date()
+            start = (bars[0].time - start).date()
 
         if start and last <= start:
             break
 
+        if len(result.bars) < DOMESTIC_MAX_RECORDS:
+            # 최대 레코드 수보다 적게 반환된 경우 마지막 페이지이므로, 빈 페이지를 추가로 조회하지 않습니다.
+            break
+
         cursor = last - period_delta
 
-    return drop_after(
+    return _sort_domestic_daily_chart(
         chart,
+        bars,
         start=start,
         end=end,
     )
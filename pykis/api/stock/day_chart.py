@@ -198,14 +198,6 @@ class KisForeignTradingHours(KisDynamic, KisTradingHoursBase):
     def __init__(self, market: MARKET_TYPE):
         self.market = market
 
-    def __post_init__(self):
-        super().__post_init__()
-
-        self.open.replace(tzinfo=self.timezone)
-        self.open_kst.replace(tzinfo=TIMEZONE)
-        self.close.replace(tzinfo=self.timezone)
-        self.close_kst.replace(tzinfo=TIMEZONE)
-
 
 class KisForeignDayChart(KisResponse, KisChartBase):
     """한국투자증권 해외 당일 차트"""
@@ -286,8 +278,9 @@ def drop_after(
         if period and i % period != 0:
             continue
 
-        bars.insert(0, bar)
+        bars.append(bar)
 
+    bars.reverse()
     chart.bars = bars
 
     return chart
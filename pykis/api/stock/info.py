@@ -319,6 +319,9 @@ def quotable_market(
             ):
                 continue
 
+            if use_cache:
+                self.cache.set(f"quotable_market:{market}:{symbol}", market_type, expire=timedelta(days=1))
+
             return market_type
         except AttributeError:
             pass
@@ -372,6 +375,13 @@ def info(
             use_cache=use_cache,
         )
 
+        # 상품기본정보는 해석된 상품유형명으로 캐시되므로, 해석된 상품유형명으로 다시 조회합니다.
+        if use_cache:
+            cached = self.cache.get(f"info:{market}:{symbol}", _KisStockInfo)
+
+            if cached:
+                return cached
+
     ex = None
 
     for market_ in MARKET_TYPE_MAP[market]:
@@ -431,10 +441,21 @@ def resolve_market(
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 종목 코드가 올바르지 않은 경우
     """
-    return info(
+    if use_cache:
+        cached: MARKET_TYPE = self.cache.get(f"resolve_market:{market}:{quotable}:{symbol}", str)  # type: ignore
+
+        if cached:
+            return cached
+
+    result = info(
         self,
         symbol=symbol,
         market=market,
         use_cache=use_cache,
         quotable=quotable,
     ).market
+
+    if use_cache:
+        self.cache.set(f"resolve_market:{market}:{quotable}:{symbol}", result, expire=timedelta(days=1))
+
+    return result
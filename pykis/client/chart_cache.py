@@ -0,0 +1,145 @@
+import json
+import sqlite3
+from datetime import date
+from multiprocessing import Lock
+from multiprocessing.synchronize import Lock as LockType
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+from pykis.utils.workspace import get_cache_path
+
+__all__ = [
+    "KisChartCacheStorage",
+]
+
+
+class KisChartCacheStorage:
+    """
+    기간 차트 캐시 저장소
+
+    장이 마감된 봉은 변경되지 않으므로, 조회한 봉의 원본 응답 데이터와 조회가 완료된 기간을 SQLite에 저장합니다.
+    차트 조회 시 저장된 기간은 다시 조회하지 않고, 저장되지 않은 기간만 조회합니다.
+
+    Example:
+        >>> kis.chart_cache = KisChartCacheStorage()  # 기본 저장 경로: `~/.pykis/cache/chart.db`
+    """
+
+    __slots__ = [
+        "path",
+        "_connection",
+        "_lock",
+    ]
+
+    path: Path
+    """저장 경로"""
+    _connection: sqlite3.Connection
+    """SQLite 연결"""
+    _lock: LockType
+    """Lock 객체"""
+
+    def __init__(self, path: str | PathLike[str] | Path | None = None):
+        """
+        기간 차트 캐시 저장소를 생성합니다.
+
+        Args:
+            path: 저장 경로. 기본 저장 경로: `~/.pykis/cache/chart.db`
+        """
+        self.path = Path(path).resolve() if path else get_cache_path() / "chart.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = Lock()
+
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS bars ("
+                "market TEXT, symbol TEXT, period TEXT, date TEXT, data TEXT, "
+                "PRIMARY KEY (market, symbol, period, date))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS ranges ("
+                "market TEXT, symbol TEXT, period TEXT, start TEXT, end TEXT, data TEXT, "
+                "PRIMARY KEY (market, symbol, period))"
+            )
+
+    def range(self, market: str, symbol: str, period: str) -> tuple[date, date, dict[str, Any]] | None:
+        """
+        저장된 조회 기간을 반환합니다.
+
+        Returns:
+            (시작일, 종료일, 차트 응답 데이터) 또는 저장된 기간이 없는 경우 None
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT start, end, data FROM ranges WHERE market = ? AND symbol = ? AND period = ?",
+                (market, symbol, period),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return date.fromisoformat(row[0]), date.fromisoformat(row[1]), json.loads(row[2])
+
+    def bars(self, market: str, symbol: str, period: str, start: date, end: date) -> list[dict[str, Any]]:
+        """저장된 봉의 원본 응답 데이터를 날짜 내림차순으로 반환합니다."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data FROM bars WHERE market = ? AND symbol = ? AND period = ? AND date BETWEEN ? AND ? "
+                "ORDER BY date DESC",
+                (market, symbol, period, start.isoformat(), end.isoformat()),
+            ).fetchall()
+
+        return [json.loads(row[0]) for row in rows]
+
+    def set(
+        self,
+        market: str,
+        symbol: str,
+        period: str,
+        start: date,
+        end: date,
+        data: dict[str, Any],
+        bars: dict[date, dict[str, Any]],
+    ):
+        """
+        조회가 완료된 기간과 봉을 저장합니다.
+
+        Args:
+            start: 조회가 완료된 기간의 시작일
+            end: 조회가 완료된 기간의 종료일
+            data: 차트 응답 데이터 (봉 제외)
+            bars: 날짜별 봉의 원본 응답 데이터
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?)",
+                ((market, symbol, period, time.isoformat(), json.dumps(bar)) for time, bar in bars.items()),
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO ranges VALUES (?, ?, ?, ?, ?, ?)",
+                (market, symbol, period, start.isoformat(), end.isoformat(), json.dumps(data)),
+            )
+
+    def remove(self, market: str, symbol: str, period: str | None = None):
+        """종목의 저장된 봉을 삭제합니다."""
+        with self._lock, self._connection:
+            for table in ("bars", "ranges"):
+                if period is None:
+                    self._connection.execute(f"DELETE FROM {table} WHERE market = ? AND symbol = ?", (market, symbol))
+                else:
+                    self._connection.execute(
+                        f"DELETE FROM {table} WHERE market = ? AND symbol = ? AND period = ?",
+                        (market, symbol, period),
+                    )
+
+    def clear(self):
+        """캐시를 초기화합니다."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM bars")
+            self._connection.execute("DELETE FROM ranges")
+
+    def close(self):
+        """저장소를 닫습니다."""
+        with self._lock:
+            self._connection.close()
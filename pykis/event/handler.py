@@ -1,5 +1,7 @@
 import warnings
+import weakref
 from abc import ABCMeta, abstractmethod
+from threading import RLock
 from typing import (
     Callable,
     Generic,
@@ -61,6 +63,8 @@ class KisEventFilter(Protocol[TCSender, TCEventArgs]):
 class KisEventFilterBase(Generic[TSender, TEventArgs], metaclass=ABCMeta):
     """이벤트 필터"""
 
+    __slots__ = ()
+
     @abstractmethod
     def __filter__(self, handler: "KisEventHandler", sender: TSender, e: TEventArgs) -> bool:
         """
@@ -135,6 +139,8 @@ class KisMultiEventFilter(KisEventFilterBase[TSender, TEventArgs]):
 class KisEventCallback(KisEventFilterBase[TSender, TEventArgs], metaclass=ABCMeta):
     """이벤트 콜백"""
 
+    __slots__ = ()
+
     @abstractmethod
     def __callback__(self, handler: "KisEventHandler", sender: TSender, e: TEventArgs):
         """
@@ -150,6 +156,8 @@ class KisEventCallback(KisEventFilterBase[TSender, TEventArgs], metaclass=ABCMet
 class KisLambdaEventCallback(KisEventCallback[TSender, TEventArgs]):
     """람다 이벤트 콜백"""
 
+    __slots__ = ("callback", "where", "once", "_hash", "_finalizer", "__weakref__")
+
     callback: Callable[[TSender, TEventArgs], None]
     """이벤트 콜백"""
     where: KisEventFilter[TSender, TEventArgs] | Callable[[TSender, TEventArgs], bool] | None
@@ -157,6 +165,11 @@ class KisLambdaEventCallback(KisEventCallback[TSender, TEventArgs]):
     once: bool
     """실행 후 콜백 제거 여부"""
 
+    _hash: int
+    """해시 값 (콜백과 필터는 변경되지 않으므로 생성 시 계산합니다.)"""
+    _finalizer: weakref.finalize
+    """콜백 참조 해제 함수"""
+
     def __init__(
         self,
         callback: Callable[[TSender, TEventArgs], None],
@@ -166,6 +179,9 @@ class KisLambdaEventCallback(KisEventCallback[TSender, TEventArgs]):
         self.callback = callback
         self.where = where
         self.once = once
+        self._hash = hash((callback, where))
+        self._finalizer = weakref.finalize(self, release_method, callback)
+        self._finalizer.atexit = False
 
     def __filter__(self, handler: "KisEventHandler", sender: TSender, e: TEventArgs) -> bool:
         if self.where is None:
@@ -184,10 +200,11 @@ class KisLambdaEventCallback(KisEventCallback[TSender, TEventArgs]):
             self.__callback__(handler, sender, e)
 
     def __hash__(self) -> int:
-        return hash((self.callback, self.where))
+        return self._hash
 
-    def __del__(self):
-        release_method(self.callback)
+    def release(self):
+        """콜백 참조를 해제합니다. 여러 번 호출해도 한 번만 해제됩니다."""
+        self._finalizer()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.callback!r}, where={self.where!r}, once={self.once!r})"
@@ -198,6 +215,32 @@ class KisLambdaEventCallback(KisEventCallback[TSender, TEventArgs]):
 
 EventCallback = Callable[[TSender, TEventArgs], None] | KisEventCallback[TSender, TEventArgs]
 
+_KisEventDispatch = tuple[
+    Callable[["KisEventHandler", TSender, TEventArgs], bool] | None,
+    Callable[[TSender, TEventArgs], None],
+]
+
+
+def _release_ticket(
+    name: str,
+    handler: "KisEventHandler[TSender, TEventArgs]",
+    callback: EventCallback[TSender, TEventArgs],
+):
+    """
+    가비지 컬렉션된 이벤트 티켓을 해지합니다.
+
+    같은 핸들러의 `add`/`remove`가 Lock을 보유한 채 목록을 갱신하는 중에도 호출될 수 있으며,
+    이 경우 `remove`는 제거와 콜백 참조 해제를 갱신이 끝난 뒤로 미룹니다.
+    """
+    # 2.1.1 버전 이후부터는 티켓을 명시적으로 해지하지 않으면 경고 메시지를 출력합니다.
+    if callback in handler:
+        warnings.warn(
+            f"Event ticket <{name} callback={callback}> was not explicitly unsubscribed, but was unsubscribed due to a resource release.",
+            UserWarning,
+        )
+
+    handler.remove(callback)
+
 
 class KisEventTicket(Generic[TSender, TEventArgs]):
     """이벤트 티켓"""
@@ -206,7 +249,9 @@ class KisEventTicket(Generic[TSender, TEventArgs]):
         "handler",
         "callback",
         "unsubscribed_callbacks",
-        "_suppress_del",
+        "_hash",
+        "_finalizer",
+        "__weakref__",
     )
 
     handler: "KisEventHandler[TSender, TEventArgs]"
@@ -217,8 +262,10 @@ class KisEventTicket(Generic[TSender, TEventArgs]):
     unsubscribed_callbacks: list[Callable[["KisEventTicket"], None]]
     """이벤트 콜백 제거 이벤트"""
 
-    _suppress_del: bool
-    """가비지 컬렉션에서 해지되지 않도록 합니다."""
+    _hash: int
+    """해시 값 (핸들러와 콜백은 변경되지 않으므로 생성 시 계산합니다.)"""
+    _finalizer: weakref.finalize
+    """가비지 컬렉션 시 티켓 해지 함수"""
 
     def __init__(
         self,
@@ -229,7 +276,9 @@ class KisEventTicket(Generic[TSender, TEventArgs]):
         self.handler = handler
         self.callback = callback
         self.unsubscribed_callbacks = unsubscribed_callbacks or []
-        self._suppress_del = False
+        self._hash = hash((handler, callback))
+        self._finalizer = weakref.finalize(self, _release_ticket, self.__class__.__name__, handler, callback)
+        self._finalizer.atexit = False
 
     @property
     def once(self) -> bool:
@@ -251,7 +300,7 @@ class KisEventTicket(Generic[TSender, TEventArgs]):
 
     def suppress(self):
         """가비지 컬렉션에서 해지되지 않도록 합니다."""
-        self._suppress_del = True
+        self._finalizer.detach()
 
     def __enter__(self):
         return self
@@ -259,17 +308,6 @@ class KisEventTicket(Generic[TSender, TEventArgs]):
     def __exit__(self, exc_type, exc_value, traceback):
         self.unsubscribe()
 
-    def __del__(self):
-        if not self._suppress_del:
-            # 2.1.1 버전 이후부터는 티켓을 명시적으로 해지하지 않으면 경고 메시지를 출력합니다.
-            if self.registered:
-                warnings.warn(
-                    f"Event ticket {self} was not explicitly unsubscribed, but was unsubscribed due to a resource release.",
-                    UserWarning,
-                )
-
-            self.unsubscribe()
-
     def __repr__(self):
         return f"<{self.__class__.__name__} callback={self.callback}>"
 
@@ -286,21 +324,102 @@ class KisEventTicket(Generic[TSender, TEventArgs]):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash((self.handler, self.callback))
+        return self._hash
 
 
 class KisEventHandler(Generic[TSender, TEventArgs]):
     """이벤트 핸들러"""
 
-    handlers: set[EventCallback[TSender, TEventArgs]]
-    """이벤트 핸들러 목록"""
+    handlers: dict[EventCallback[TSender, TEventArgs], "_KisEventDispatch[TSender, TEventArgs]"]
+    """이벤트 핸들러 목록 (등록 순서, 핸들러: (필터, 콜백))"""
+
+    _snapshot: tuple["_KisEventDispatch[TSender, TEventArgs]", ...]
+    """이벤트 발생 시 호출할 (필터, 콜백) 목록"""
+    _lock: RLock
+    """
+    Lock 객체
+
+    목록 갱신 중 가비지 컬렉션으로 같은 핸들러의 티켓이 해지되면 같은 스레드에서 `remove`가 호출되므로,
+    재진입 가능한 Lock을 사용합니다.
+    """
+    _updating: bool
+    """이벤트 발생 시 호출할 목록 갱신 중 여부"""
+    _pending: list[EventCallback[TSender, TEventArgs]]
+    """목록 갱신 중 제거 요청된 핸들러 목록"""
 
     def __init__(self, *handlers: EventCallback[TSender, TEventArgs]):
-        self.handlers = set(handlers)
+        self.handlers = {handler: self._dispatcher(handler) for handler in handlers}
+        self._snapshot = tuple(self.handlers.values())
+        self._lock = RLock()
+        self._updating = False
+        self._pending = []
+
+    def _dispatcher(self, handler: EventCallback[TSender, TEventArgs]) -> "_KisEventDispatch[TSender, TEventArgs]":
+        """이벤트 발생 시 호출할 필터와 콜백을 반환합니다."""
+        if not isinstance(handler, KisEventCallback):
+            return None, handler
+
+        callback = handler.__callback__
+
+        def dispatch(sender: TSender, e: TEventArgs):
+            callback(self, sender, e)
+
+        return handler.__filter__, dispatch
+
+    def _update(self) -> list[EventCallback[TSender, TEventArgs]]:
+        """
+        이벤트 발생 시 호출할 목록을 갱신합니다. Lock을 보유한 상태에서 호출해야 합니다.
+
+        Returns:
+            갱신 중 제거된 핸들러 목록. Lock을 해제한 뒤 `_release`로 참조를 해제해야 합니다.
+        """
+        released = []
+        self._updating = True
+
+        try:
+            while True:
+                # 목록 생성 중 가비지 컬렉션으로 제거 요청된 핸들러는 목록 생성 후 반영합니다.
+                snapshot = tuple(self.handlers.values())
+
+                if not self._pending:
+                    break
+
+                for handler in self._pending:
+                    self.handlers.pop(handler, None)
+
+                released.extend(self._pending)
+                self._pending.clear()
+        finally:
+            self._updating = False
+
+        self._snapshot = snapshot
+
+        return released
+
+    @staticmethod
+    def _release(handler: EventCallback[TSender, TEventArgs]):
+        """핸들러의 콜백 참조를 해제합니다."""
+        if isinstance(handler, KisLambdaEventCallback):
+            handler.release()
+        elif isinstance(handler, KisEventCallback):
+            del_method = getattr(handler, "__del__", None)
+
+            if del_method is not None:
+                del_method()
+        else:
+            release_method(handler)
 
     def add(self, handler: EventCallback[TSender, TEventArgs]) -> KisEventTicket[TSender, TEventArgs]:
         """이벤트 핸들러를 추가합니다."""
-        self.handlers.add(handler)
+        dispatch = self._dispatcher(handler)
+
+        with self._lock:
+            self.handlers[handler] = dispatch
+            released = self._update()
+
+        for removed in released:
+            self._release(removed)
+
         return KisEventTicket(self, handler)
 
     def on(
@@ -345,31 +464,37 @@ class KisEventHandler(Generic[TSender, TEventArgs]):
 
     def remove(self, handler: EventCallback[TSender, TEventArgs]):
         """이벤트 핸들러를 제거합니다."""
-        if isinstance(handler, KisEventCallback):
-            del_method = getattr(handler, "__del__", None)
+        with self._lock:
+            if self._updating:
+                # 목록 갱신 중 가비지 컬렉션된 티켓의 해지 요청은 갱신을 마친 뒤 처리하며,
+                # 콜백 참조 해제도 Lock을 해제한 뒤 갱신을 요청한 쪽에서 수행합니다.
+                self._pending.append(handler)
+                return
 
-            if del_method is not None:
-                del_method()
-        else:
-            release_method(handler)
+            released = self._update() if self.handlers.pop(handler, None) is not None else []
 
-        try:
-            self.handlers.remove(handler)
-        except KeyError:
-            pass
+        self._release(handler)
+
+        for removed in released:
+            self._release(removed)
 
     def clear(self):
         """이벤트 핸들러를 모두 제거합니다."""
-        self.handlers.clear()
+        with self._lock:
+            self.handlers.clear()
+            self._pending.clear()
+            self._snapshot = ()
 
     def invoke(self, sender: TSender, e: TEventArgs):
         """이벤트를 발생시킵니다."""
-        for handler in self.handlers.copy():
-            if isinstance(handler, KisEventCallback):
-                if not handler.__filter__(self, sender, e):
-                    handler.__callback__(self, sender, e)
-            else:
-                handler(sender, e)
+        # 이벤트 처리 중 핸들러가 추가/제거될 수 있으므로, 변경 시점에 만들어둔 목록을 순회합니다.
+        # 필터를 먼저 모두 평가한 뒤, 통과한 콜백만 호출합니다.
+        callbacks = [
+            callback for filter, callback in self._snapshot if filter is None or not filter(self, sender, e)
+        ]
+
+        for callback in callbacks:
+            callback(sender, e)
 
     def __call__(self, sender: TSender, e: TEventArgs):
         """이벤트를 발생시킵니다."""
@@ -402,13 +527,11 @@ class KisEventHandler(Generic[TSender, TEventArgs]):
         return repr(self)
 
     def __eq__(self, other):
-        if isinstance(other, KisEventHandler):
-            return self.handlers == other.handlers
-
-        return False
+        # 핸들러 목록은 변경 가능하므로, 객체 자체로 비교합니다.
+        return self is other
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(self.handlers)
+        return id(self)
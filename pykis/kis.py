@@ -22,6 +22,7 @@ from pykis.client.account import KisAccountNumber
 from pykis.client.appkey import KisKey
 from pykis.client.auth import KisAuth
 from pykis.client.cache import KisCacheStorage
+from pykis.client.chart_cache import KisChartCacheStorage
 from pykis.client.exceptions import KisHTTPError
 from pykis.client.form import KisForm
 from pykis.client.object import KisObjectBase, kis_object_init
@@ -50,6 +51,8 @@ class PyKis:
 
     cache: KisCacheStorage
     """캐시 저장소"""
+    chart_cache: KisChartCacheStorage | None = None
+    """기간 차트 캐시 저장소. 지정된 경우 장이 마감된 원주가 일봉을 저장하고 재사용합니다."""
 
     _rate_limiters: dict[str, RateLimiter]
     """API 호출 제한"""
@@ -269,14 +269,45 @@ class KisObject(Generic[TDynamic], KisType[TDynamic], metaclass=KisTypeMeta):
                 parsing_data = scoped_path(data)
 
         ignore_missing = ignore_missing or getattr(object_type, "__ignore_missing__", False)
+        missing = set(parsing_data.keys())
+        missing.discard("__response__")
+
+        cls.populator_(object_type, scope)(object, data, parsing_data, missing, ignore_missing)
+
+        if missing and getattr(object_type, "__verbose_missing__", False):
+            if ignore_missing_fields is not None:
+                missing -= ignore_missing_fields
+
+            if missing:
+                logging.logger.warning(f"{object_type.__name__}에 정의되지 않은 필드가 있습니다: {', '.join(missing)}")
+
+        setattr(object, "__data__", data)
+
+        if post_init and hasattr(object, "__post_init__"):
+            object.__post_init__()
+
+        return object  # type: ignore
+
+    @staticmethod
+    def fields_(object_type: type) -> tuple[tuple[str, KisType[Any], str | None, bool | None], ...]:
+        """
+        응답 타입의 필드 목록을 반환합니다.
+
+        필드 목록은 타입별로 한 번만 계산되며, 리스트 응답의 각 항목을 변환할 때 재사용됩니다.
+
+        Returns:
+            (속성명, 응답 타입, 응답 필드, nullable 여부) 목록
+        """
+        if (fields := _fields_cache.get(object_type)) is not None:
+            return fields
+
         annotations = {
             key: value
             for obj in object_type.__mro__
             if (annotations := getattr(obj, "__annotations__", None)) is not None
             for key, value in annotations.items()
         }
-        missing = set(parsing_data.keys())
-        missing.discard("__response__")
+        result = []
 
         for key, type_, anno in (
             (field, type_, annotations.get(field, None))
@@ -295,65 +326,108 @@ class KisObject(Generic[TDynamic], KisType[TDynamic], metaclass=KisTypeMeta):
 
                 type_ = type_.default_type()
 
+            result.append(
+                (
+                    key,
+                    type_,
+                    None if isinstance(type_, KisTransform) else type_.field or key,
+                    NoneType in get_args(anno) if anno else None,
+                )
+            )
+
+        fields = _fields_cache[object_type] = tuple(result)
+
+        return fields
+
+    @classmethod
+    def populator_(
+        cls, object_type: type, scope: str | None = None
+    ) -> Callable[[Any, dict[str, Any], dict[str, Any], set[str], bool], None]:
+        """
+        응답 타입의 필드 변환 함수를 반환합니다.
+
+        필드 목록을 기반으로 필드별 변환 코드를 펼친 함수를 타입과 응답 범위별로 한 번만 생성하여,
+        리스트 응답의 각 항목을 변환할 때 필드 목록 순회와 분기 판단을 생략합니다.
+
+        Args:
+            object_type: 응답 타입
+            scope: 응답 범위. 지정된 경우 해당 범위의 필드만 변환합니다.
+
+        Returns:
+            (객체, 응답 데이터, 응답 데이터 위치의 데이터, 정의되지 않은 필드 목록, 누락 필드 무시 여부)를 받는 함수
+        """
+        if (populate := _populate_cache.get((object_type, scope))) is not None:
+            return populate
+
+        namespace: dict[str, Any] = {
+            "_empty": empty,
+            "_KisNoneValueError": KisNoneValueError,
+        }
+        lines = ["def _populate(object, data, parsing_data, missing, ignore_missing):"]
+
+        for i, (key, type_, field, nullable) in enumerate(cls.fields_(object_type)):
             if scope is not None and type_.scope != scope:
                 continue
 
-            field = None if isinstance(type_, KisTransform) else type_.field or key
-            nullable = NoneType in get_args(anno) if anno else None
-            target_data = data if type_.absolute else parsing_data
-
-            if field is not None and target_data is parsing_data:
-                missing.discard(field)
+            target = "data" if type_.absolute else "parsing_data"
+            namespace[f"_transform{i}"] = type_.transform
+            namespace[f"_convert_error{i}"] = f"{object_type.__name__}.{key} 필드를 변환하는 중 오류가 발생했습니다.\n→ "
 
             if field is None:
-                value = target_data
-            elif field not in target_data:
-                if type_.default is empty:
-                    if ignore_missing:
-                        continue
+                lines.append(f"    value = {target}")
+            else:
+                if type_.absolute:
+                    lines.append(f"    if data is parsing_data: missing.discard({field!r})")
+                else:
+                    lines.append(f"    missing.discard({field!r})")
 
-                    raise KeyError(f"{object_type.__name__}.{key} 필드의 {field}값이 존재하지 않습니다. ({type_!r})")
+                lines.append(f"    value = {target}.get({field!r}, _empty)")
 
-                if callable(type_.default):
-                    value = type_.default()
+                if type_.default is empty:
+                    namespace[f"_missing_error{i}"] = (
+                        f"{object_type.__name__}.{key} 필드의 {field}값이 존재하지 않습니다. ({type_!r})"
+                    )
+                    lines.append("    if value is _empty and not ignore_missing:")
+                    lines.append(f"        raise KeyError(_missing_error{i})")
                 else:
-                    value = type_.default
+                    namespace[f"_default{i}"] = type_.default
+                    lines.append("    if value is _empty:")
+                    lines.append(f"        value = _default{i}{'()' if callable(type_.default) else ''}")
+
+            lines.append("    if value is not _empty:")
+            lines.append("        result = _empty")
+            lines.append("        if value is not None:")
+            lines.append("            try:")
+            lines.append(f"                result = _transform{i}(value)")
+            lines.append("            except _KisNoneValueError:")
+            lines.append("                pass")
+            lines.append("            except Exception as e:")
+            lines.append(f"                raise ValueError(f\"{{_convert_error{i}}}{{type(e).__name__}}: {{e}}\") from e")
+            lines.append("        if result is _empty:")
+
+            if nullable:
+                lines.append("            result = None")
             else:
-                value = target_data[field]
-
-            result = empty
+                namespace[f"_empty_error{i}"] = f"{object_type.__name__}.{key} 필드의 값이 빈 값입니다."
+                lines.append(f"            raise ValueError(_empty_error{i})")
 
-            if value is not None:
-                try:
-                    result = type_.transform(value)
-                except KisNoneValueError:
-                    pass
-                except Exception as e:
-                    raise ValueError(
-                        f"{object_type.__name__}.{key} 필드를 변환하는 중 오류가 발생했습니다.\n→ {type(e).__name__}: {e}"
-                    ) from e
-
-            if result is empty:
-                if nullable:
-                    result = None
-                else:
-                    raise ValueError(f"{object_type.__name__}.{key} 필드의 값이 빈 값입니다.")
+            lines.append(f"        object.{key} = result")
 
-            setattr(object, key, result)
+        lines.append("    pass")
 
-        if missing and getattr(object_type, "__verbose_missing__", False):
-            if ignore_missing_fields is not None:
-                missing -= ignore_missing_fields
+        exec("\n".join(lines), namespace)
+        populate = _populate_cache[object_type, scope] = namespace["_populate"]
 
-            if missing:
-                logging.logger.warning(f"{object_type.__name__}에 정의되지 않은 필드가 있습니다: {', '.join(missing)}")
+        return populate
 
-        setattr(object, "__data__", data)
 
-        if post_init and hasattr(object, "__post_init__"):
-            object.__post_init__()
+_fields_cache: dict[type, tuple[tuple[str, KisType[Any], str | None, bool | None], ...]] = {}
+"""응답 타입별 필드 목록 캐시"""
 
-        return object  # type: ignore
+_populate_cache: dict[
+    tuple[type, str | None], Callable[[Any, dict[str, Any], dict[str, Any], set[str], bool], None]
+] = {}
+"""응답 타입 및 응답 범위별 필드 변환 함수 캐시"""
 
 
 class KisNoneValueError(Exception):
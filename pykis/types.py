@@ -63,6 +63,7 @@ from pykis.client.account import KisAccountNumber
 from pykis.client.appkey import KisKey
 from pykis.client.auth import KisAuth
 from pykis.client.cache import KisCacheStorage
+from pykis.client.chart_cache import KisChartCacheStorage
 from pykis.client.form import KisForm
 from pykis.client.messaging import (
     KisWebsocketEncryptionKey,
@@ -133,6 +134,7 @@ __all__ = [
     "KisKey",
     "KisAuth",
     "KisCacheStorage",
+    "KisChartCacheStorage",
     "KisForm",
     "KisPage",
     "KisPageStatus",
@@ -0,0 +1,162 @@
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+from unittest import TestCase
+
+from pykis.api.stock.daily_chart import KisDomesticDailyChart, domestic_daily_chart
+from pykis.client.chart_cache import KisChartCacheStorage
+from pykis.responses.dynamic import KisObject
+from pykis.utils.timezone import TIMEZONE
+
+LISTED = date(2015, 1, 2)
+
+
+def _row(day: date) -> dict[str, str]:
+    return {
+        "stck_bsop_date": day.strftime("%Y%m%d"),
+        "stck_clpr": "100",
+        "stck_oprc": "99",
+        "stck_hgpr": "101",
+        "stck_lwpr": "98",
+        "acml_vol": "10",
+        "acml_tr_pbmn": "1000",
+        "flng_cls_code": "00",
+        "prtt_rate": "0.00",
+        "mod_yn": "N",
+        "prdy_vrss_sign": "3",
+        "prdy_vrss": "0",
+        "revl_issu_reas": "",
+    }
+
+
+def _trading_days(start: date, end: date) -> list[date]:
+    days = []
+    day = max(start, LISTED)
+
+    while day <= end:
+        if day.weekday() < 5:
+            days.append(day)
+
+        day += timedelta(days=1)
+
+    return days
+
+
+class FakeKis:
+    """국내주식기간별시세 응답을 흉내내는 오프라인 PyKis"""
+
+    def __init__(self, chart_cache: KisChartCacheStorage):
+        self.chart_cache = chart_cache
+        self.requests: list[tuple[date, date, str, str]] = []
+
+    def fetch(self, path, api, params, response_type, domain):
+        start = datetime.strptime(params["FID_INPUT_DATE_1"].zfill(8), "%Y%m%d").date()
+        end = datetime.strptime(params["FID_INPUT_DATE_2"], "%Y%m%d").date()
+        self.requests.append((start, end, params["FID_PERIOD_DIV_CODE"], params["FID_ORG_ADJ_PRC"]))
+
+        return KisObject.transform_(
+            {
+                "rt_cd": "0",
+                "msg_cd": "MCA00000",
+                "msg1": "정상처리 되었습니다.",
+                "__response__": None,
+                "output1": {"stck_prpr": "100"},
+                "output2": [_row(day) for day in reversed(_trading_days(start, end))][:100],
+            },
+            response_type,
+        )
+
+
+class ChartCacheTests(TestCase):
+    kis: FakeKis
+    cache: KisChartCacheStorage
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = KisChartCacheStorage(os.path.join(self.directory.name, "chart.db"))
+        self.kis = FakeKis(self.cache)
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        self.directory.cleanup()
+
+    def query(self, start: date, end: date, **kwargs) -> KisDomesticDailyChart:
+        self.kis.requests.clear()
+        chart = domestic_daily_chart(self.kis, "005930", start=start, end=end, **kwargs)  # type: ignore
+        self.assertEqual([bar.time.date() for bar in chart.bars], _trading_days(start, end))
+
+        return chart
+
+    def cached_range(self) -> tuple[date, date] | None:
+        cached = self.cache.range("KRX", "005930", "day")
+        return cached[:2] if cached else None
+
+    def test_repeat_query(self):
+        self.query(date(2023, 1, 1), date(2023, 6, 30))
+        self.assertTrue(self.kis.requests)
+        self.assertEqual(self.cached_range(), (date(2023, 1, 1), date(2023, 6, 30)))
+
+        chart = self.query(date(2023, 1, 1), date(2023, 6, 30))
+        self.assertEqual(self.kis.requests, [])
+        self.assertTrue(isinstance(chart, KisDomesticDailyChart))
+        self.assertEqual(chart.symbol, "005930")
+
+    def test_inner_range(self):
+        self.query(date(2023, 1, 1), date(2023, 6, 30))
+        self.query(date(2023, 3, 1), date(2023, 4, 30))
+        self.assertEqual(self.kis.requests, [])
+
+    def test_superset_fetches_edges(self):
+        self.query(date(2023, 1, 1), date(2023, 6, 30))
+        self.query(date(2022, 10, 1), date(2023, 9, 30))
+
+        self.assertTrue(self.kis.requests)
+
+        for start, end, _, _ in self.kis.requests:
+            self.assertTrue(end < date(2023, 1, 1) or start > date(2023, 6, 30))
+
+        self.assertEqual(self.cached_range(), (date(2022, 10, 1), date(2023, 9, 30)))
+        self.query(date(2022, 10, 1), date(2023, 9, 30))
+        self.assertEqual(self.kis.requests, [])
+
+    def test_adjacent_ranges_merge(self):
+        self.query(date(2023, 1, 1), date(2023, 6, 30))
+        self.query(date(2023, 7, 1), date(2023, 7, 31))
+        self.assertEqual(self.cached_range(), (date(2023, 1, 1), date(2023, 7, 31)))
+
+    def test_disjoint_ranges_keep_longer(self):
+        self.query(date(2023, 1, 1), date(2023, 6, 30))
+        self.query(date(2020, 1, 1), date(2020, 1, 31))
+        self.assertEqual(self.cached_range(), (date(2023, 1, 1), date(2023, 6, 30)))
+
+        self.query(date(2019, 1, 1), date(2020, 12, 31))
+        self.assertEqual(self.cached_range(), (date(2019, 1, 1), date(2020, 12, 31)))
+
+    def test_today_not_saved(self):
+        today = datetime.now(TIMEZONE).date()
+        self.query(today - timedelta(days=30), today)
+
+        start, end = self.cached_range()  # type: ignore
+        self.assertLess(end, today)
+        self.assertEqual(self.cache.bars("KRX", "005930", "day", today, today), [])
+
+        self.query(today - timedelta(days=30), today)
+        self.assertEqual(len(self.kis.requests), 1)
+        self.assertEqual(self.kis.requests[0][:2], (today, today))
+
+    def test_adjust_skips_cache(self):
+        self.query(date(2023, 1, 1), date(2023, 6, 30), adjust=True)
+        self.assertIsNone(self.cached_range())
+
+        self.query(date(2023, 1, 1), date(2023, 6, 30))
+        self.query(date(2023, 1, 1), date(2023, 6, 30), adjust=True)
+        self.assertTrue(self.kis.requests)
+
+    def test_period_skips_cache(self):
+        self.query(date(2023, 1, 1), date(2023, 6, 30))
+        self.kis.requests.clear()
+        domestic_daily_chart(self.kis, "005930", start=date(2023, 1, 1), end=date(2023, 6, 30), period="week")  # type: ignore
+
+        self.assertTrue(self.kis.requests)
+        self.assertTrue(all(period == "W" for _, _, period, _ in self.kis.requests))
+        self.assertIsNone(self.cache.range("KRX", "005930", "week"))
@@ -0,0 +1,82 @@
+import gc
+import threading
+import warnings
+from unittest import TestCase
+
+from pykis.event.handler import KisEventHandler, KisEventTicket
+
+
+class _Owner:
+    """순환 참조로 인해 가비지 컬렉션 시점에 티켓이 해지되는 객체"""
+
+    def __init__(self, handler: KisEventHandler):
+        self.owner = self
+        self.ticket = handler.on(lambda sender, e: None)
+
+
+class EventHandlerTests(TestCase):
+    def setUp(self) -> None:
+        self.threshold = gc.get_threshold()
+
+    def tearDown(self) -> None:
+        gc.set_threshold(*self.threshold)
+
+    def run_stress(self, handler: KisEventHandler, kept: list[KisEventTicket], threads: int = 1):
+        def stress():
+            for _ in range(300):
+                _Owner(handler)
+                ticket = handler.on(lambda sender, e: None)
+                kept.append(ticket)
+                ticket.unsubscribe()
+                kept.append(handler.on(lambda sender, e: None))
+
+        workers = [threading.Thread(target=stress, daemon=True) for _ in range(threads)]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            gc.set_threshold(1, 1, 1)
+
+            for worker in workers:
+                worker.start()
+
+            for worker in workers:
+                worker.join(timeout=30)
+
+            gc.set_threshold(*self.threshold)
+            # 티켓이 add/remove 도중 가비지 컬렉션되어도 교착 상태에 빠지지 않아야 합니다.
+            self.assertFalse(any(worker.is_alive() for worker in workers))
+            self.addCleanup(lambda: [ticket.unsubscribe() for ticket in kept])
+            gc.collect()
+
+    def assert_consistent(self, handler: KisEventHandler, kept: list[KisEventTicket]):
+        self.assertEqual(handler._pending, [])
+        self.assertFalse(handler._updating)
+        self.assertEqual(handler._snapshot, tuple(handler.handlers.values()))
+        self.assertEqual(set(handler), {ticket.callback for ticket in kept if ticket.registered})
+
+    def test_collect_during_update(self):
+        handler = KisEventHandler()
+        kept: list[KisEventTicket] = []
+
+        self.run_stress(handler, kept)
+        self.assert_consistent(handler, kept)
+        self.assertEqual(len(handler), 300)
+
+    def test_collect_during_update_threads(self):
+        handler = KisEventHandler()
+        kept: list[KisEventTicket] = []
+
+        self.run_stress(handler, kept, threads=4)
+        self.assert_consistent(handler, kept)
+        self.assertEqual(len(handler), 1200)
+
+    def test_invoke_after_collect(self):
+        handler = KisEventHandler()
+        kept: list[KisEventTicket] = []
+        calls = []
+
+        self.run_stress(handler, kept)
+        kept.append(handler.on(lambda sender, e: calls.append(e)))
+        handler.invoke(None, 1)
+
+        self.assertEqual(calls, [1])